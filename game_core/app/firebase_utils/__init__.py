@@ -1,2 +1,2 @@
 from firebase_admin import firestore  # type:  ignore
-from .firebase import app, db
+from .firebase import app, client, db
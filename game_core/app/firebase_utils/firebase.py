@@ -6,7 +6,8 @@ env = Env()
 environment = env("ENVIRONMENT", "production")
 
 app = firebase_admin.initialize_app()
-db = firestore.client()
+client = firestore.client()
+db = client
 
 if environment == "testing":
-    db = db.collection("test").document("testing")
+    db = client.collection("test").document("testing")
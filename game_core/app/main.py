@@ -1,5 +1,6 @@
 """ Game core """
 
+import logging
 import structlog  # type: ignore
 from environs import Env
 
@@ -13,7 +14,9 @@ from firebase_admin.auth import (  # type:  ignore
     RevokedIdTokenError,
 )
 from github import Github, BadCredentialsException
+from google.cloud.firestore_v1.document import DocumentReference  # type: ignore
 
+from firebase_utils import client
 from github_utils import verify_signature, check_repo_ours, GitHubHookFork
 from user import User, Source, UserData
 from game import Game
@@ -23,6 +26,14 @@ from framework import inject_http_model, inject_pubsub_model, StatusReturn
 
 env = Env()
 CORS_ORIGIN = env("CORS_ORIGIN", "https://lgtm.meseta.dev")
+TICK_BATCH_WRITES = 10  # quest saves per commit, bounds progress lost if killed
+
+# debug logs in hot loops become no-ops below the configured level
+structlog.configure(
+    wrapper_class=structlog.make_filtering_bound_logger(
+        env.log_level("LOG_LEVEL", logging.INFO)
+    )
+)
 
 logger = structlog.get_logger(__name__).bind(version=env("APP_VERSION", "test"))
 logger.info("Started")
@@ -50,16 +61,32 @@ def github_webhook_listener(request: Request, hook_fork: GitHubHookFork):
     user = User.from_source_id(source=Source.GITHUB, user_id=user_id)
     game = Game.from_user(user)
     game.set_fork_url(fork_url)
-    game.save()
+    quest_page = QuestPage.from_game_get_first_quest(game)
 
-    logger.info("Created new game for user", game=game, user=user)
+    game_ref = game.doc_ref
+    quest_ref = quest_page.doc_ref
+    if not isinstance(game_ref, DocumentReference):  # pragma: no cover
+        return StatusReturn(error="Missing game key", http_code=500)
+    if not isinstance(quest_ref, DocumentReference):  # pragma: no cover
+        return StatusReturn(error="Missing quest key", http_code=500)
 
-    # Get first quest, and execute it if it doesn't already exist
-    quest_page = QuestPage.from_game_get_first_quest(game)
-    if not quest_page.exists:
+    # fetch existence of both documents in one round trip
+    snapshots = {
+        snapshot.reference.path: snapshot
+        for snapshot in client.get_all([game_ref, quest_ref])
+    }
+
+    # write the game, and the first quest if it doesn't already exist, in one batch
+    batch = client.batch()
+    game.save(batch, exists=snapshots[game_ref.path].exists)
+
+    if not snapshots[quest_ref.path].exists:
         logger.info("Creating new quest", quest_page=quest_page)
         quest_page.execute(TickType.FULL)
-        quest_page.save()
+        quest_page.save(batch, exists=False)
+
+    batch.commit()
+    logger.info("Created new game for user", game=game, user=user)
 
     logger.info("Done creating new game")
 
@@ -114,7 +141,21 @@ def tick(tick_event: TickEvent):
     """ Game tick """
     logger.info("Tick", tick_event=tick_event)
 
-    for quest_page in QuestPage.iterate_all():
-        logger.info("Executing quest", quest_page=quest_page)
-        quest_page.execute(tick_event.tick_type)
-        quest_page.save()
+    # quest saves are batched, committing whatever was written even on failure
+    batch = client.batch()
+    batch_writes = 0
+    try:
+        for quest_page in QuestPage.iterate_all():
+            logger.info("Executing quest", quest_page=quest_page)
+            quest_page.execute(tick_event.tick_type)
+            quest_page.save(batch)
+            batch_writes += 1
+
+            if batch_writes >= TICK_BATCH_WRITES:
+                # reset first, so a failed commit isn't retried by the finally
+                batch_writes = 0
+                batch.commit()
+                batch = client.batch()
+    finally:
+        if batch_writes:
+            batch.commit()
@@ -1,12 +1,16 @@
 """ ORM wrapper around firebase """
 
 from __future__ import annotations
-from typing import ClassVar, Type, Union, Any, Generator, Dict
+from typing import ClassVar, Type, Union, Any, Generator, Dict, Optional
 from abc import ABC, abstractmethod
 from pydantic import BaseModel
 
-from google.cloud.firestore_v1.document import DocumentReference  # type: ignore
+from google.cloud.firestore_v1.document import (  # type: ignore
+    DocumentReference,
+    DocumentSnapshot,
+)
 from google.cloud.firestore_v1.collection import CollectionReference  # type: ignore
+from google.cloud.firestore_v1.batch import WriteBatch  # type: ignore
 from firebase_utils import db, firestore
 
 from .sentinels import (
@@ -68,10 +72,14 @@ class Orm(ABC):
     parent_key: Union[str, NoKeyType]
     data: BaseModel
 
+    # existence as of the last read or write, saves re-reading it on save
+    _exists: Optional[bool]
+
     def __init__(self, key: Union[str, NoKeyType] = NoKey):
         self.key = key
         self.data = self.storage_model()
         self.parent_key = NoKey
+        self._exists = None
 
     @property
     def parent(self) -> Union[Orm, OrmNotFoundType]:
@@ -93,7 +101,9 @@ class Orm(ABC):
         """ Whether object exists in the database """
         doc_ref = self.doc_ref
         if isinstance(doc_ref, DocumentReference):
-            return doc_ref.get().exists
+            exists = doc_ref.get().exists
+            self._exists = exists
+            return exists
         return False
 
     def load(self) -> None:
@@ -102,9 +112,13 @@ class Orm(ABC):
         if not isinstance(doc_ref, DocumentReference):
             return
 
-        doc = doc_ref.get()
-        if doc.exists:
-            self.load_storage_model(doc.to_dict())
+        self.load_snapshot(doc_ref.get())
+
+    def load_snapshot(self, snapshot: DocumentSnapshot) -> None:
+        """ Load data from an already-fetched snapshot """
+        self._exists = snapshot.exists
+        if snapshot.exists:
+            self.load_storage_model(snapshot.to_dict())
 
     def load_storage_model(self, data: dict) -> None:
         """ Load the data from dict """
@@ -120,29 +134,47 @@ class Orm(ABC):
         """ Get the data as a dict """
         return self.data.dict()
 
-    def save(self):
+    def save(
+        self, batch: Optional[WriteBatch] = None, exists: Optional[bool] = None
+    ) -> None:
+        """Save data to database. If a batch is given, the write is added to it
+        instead of being sent, and if exists is given the existence check is skipped"""
         doc_data = {
             **self.get_storage_model(),
             "parent_key": self.parent_key if self.parent_key is not NoKey else None,
         }
 
-        if self.exists:
+        if exists is None:
+            exists = self._exists if self._exists is not None else self.exists
+
+        if exists:
             doc_data["updated"] = firestore.SERVER_TIMESTAMP
-            self.doc_ref.set(doc_data, merge=True)
         else:
             doc_data["created"] = firestore.SERVER_TIMESTAMP
 
             if self.key is NoKey:
-                _, doc = self.col_ref.add(doc_data)
-                self.key = doc.id
-            else:
-                doc = self.doc_ref.set(doc_data)
+                self.key = self.col_ref.document().id
+
+        doc_ref = self.doc_ref
+        if not isinstance(doc_ref, DocumentReference):  # pragma: no cover
+            return
+
+        # merge only top-level fields, so nested maps are replaced rather than merged
+        merge = list(doc_data) if exists else False
+
+        if batch is None:
+            doc_ref.set(doc_data, merge=merge)
+            self._exists = True
+        else:
+            # existence is only known once the caller commits the batch
+            batch.set(doc_ref, doc_data, merge=merge)
 
     def delete(self):
         doc_ref = self.doc_ref
         if not isinstance(doc_ref, DocumentReference):
             return
         doc_ref.delete()
+        self._exists = False
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(key={self.key})"
@@ -1,11 +1,14 @@
 """ Base Classes for quest objects """
 from __future__ import annotations
 
-from typing import List, Dict, ClassVar, Type, cast, TYPE_CHECKING
+from typing import List, Dict, Tuple, Any, Union, ClassVar, Type, cast, TYPE_CHECKING
 
+import json
 from abc import ABC, abstractmethod
-from inspect import isclass
 from graphlib import TopologicalSorter, CycleError
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from functools import lru_cache
 
 from structlog import get_logger
 from pydantic import ValidationError
@@ -14,6 +17,7 @@ from semver import VersionInfo  # type:  ignore
 from tick import TickType
 from .exceptions import QuestError, QuestLoadError, QuestDefinitionError
 from .models import Difficulty, QuestBaseModel
+from .stage import stage_registry, FinalStage
 
 
 if TYPE_CHECKING:
@@ -22,6 +26,12 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# maximum number of ready stages to execute concurrently
+MAX_STAGE_WORKERS = 10
+
+# saved versions repeat across quest pages, so parse each one only once
+parse_version = lru_cache(maxsize=256)(VersionInfo.parse)
+
 
 def semver_safe(start: VersionInfo, dest: VersionInfo) -> bool:
     """ whether semver loading is going to be safe """
@@ -35,6 +45,22 @@ def semver_safe(start: VersionInfo, dest: VersionInfo) -> bool:
     return True
 
 
+def run_stage(stage: Stage) -> bool:
+    """ Executes a stage, returning whether it reports done """
+    stage.execute()
+    return stage.is_done()
+
+
+def execute_stages(runnable: List[Tuple[str, Stage]]) -> List[bool]:
+    """ Executes independent stages, using a thread pool if there's more than one """
+    stages = [stage for _, stage in runnable]
+    if len(stages) <= 1:
+        return [run_stage(stage) for stage in stages]
+
+    with ThreadPoolExecutor(max_workers=MAX_STAGE_WORKERS) as pool:
+        return list(pool.map(run_stage, stages))
+
+
 class Quest(ABC):
     @classmethod
     def from_name(cls, name: str, quest_page: QuestPage) -> Quest:
@@ -74,52 +100,75 @@ class Quest(ABC):
     # default, overridable model is empty pydantic model
     QuestDataModel: ClassVar[Type[QuestBaseModel]] = QuestBaseModel
 
+    # (child, parent) edges of the stage graph, built once per class
+    stage_edges: ClassVar[List[Tuple[str, str]]]
+
     def __init_subclass__(cls):
         """ Subclasses instantiate by copying default data """
-        from .stage import Stage  # avoid cyclic import
 
-        # build class list
-        cls.stages = {}
-        for name, class_var in vars(cls).items():
-            if isclass(class_var) and issubclass(class_var, Stage):
-                cls.stages[name] = class_var
+        # collect the stages that registered themselves while the class body ran,
+        # stages must be defined inline as ones bound by assignment don't register
+        cls.stages = stage_registry.pop(f"{cls.__module__}.{cls.__qualname__}", {})
+
+        # build and validate graph edges, the graph doesn't change per instance
+        cls.stage_edges = []
+        for stage_name, StageClass in cls.stages.items():
+            for child_name in cast(List[str], StageClass.children):
+                if child_name not in cls.stages:
+                    raise QuestDefinitionError(
+                        f"{cls.__name__} does not have stage named '{child_name}'"
+                    )
+                cls.stage_edges.append((child_name, stage_name))
+
+        graph: TopologicalSorter = TopologicalSorter()
+        for child_name, stage_name in cls.stage_edges:
+            graph.add(child_name, stage_name)
+
+        try:
+            graph.prepare()
+        except CycleError as err:
+            raise QuestDefinitionError(f"{cls.__name__} prepare failed! {err}") from err
 
     # loaded player quest data
     quest_data: QuestBaseModel
     graph: TopologicalSorter
 
+    # held by stages writing quest_data, as sibling stages execute concurrently
+    lock: Lock
+
     # the parent object
     quest_page: QuestPage
 
     def __init__(self, quest_page):
         self.quest_page = quest_page
         self.quest_data = self.QuestDataModel()
-        self.load_stages()
+        self.lock = Lock()
 
     def load_stages(self) -> None:
-        """ loads the stages """
+        """ loads the stages, leaving out already completed ones """
+        completed = self.quest_page.data.completed_stages
 
-        # load graph
+        # load graph, edges are already validated at class definition
         self.graph = TopologicalSorter()
-        for stage_name, StageClass in self.stages.items():
-            for child_name in cast(List[str], StageClass.children):
-                if child_name not in self.stages:
-                    raise QuestDefinitionError(
-                        f"{self} does not have stage named '{child_name}'"
-                    )
+        for child_name, stage_name in self.stage_edges:
+            if child_name in completed and stage_name in completed:
+                continue
+            if stage_name in completed:
+                self.graph.add(child_name)
+            elif child_name in completed:
+                self.graph.add(stage_name)
+            else:
                 self.graph.add(child_name, stage_name)
+        self.graph.prepare()
 
-        try:
-            self.graph.prepare()
-        except CycleError as err:
-            raise QuestDefinitionError(f"{self} prepare failed! {err}") from err
-
-    def load_raw(self, version_str: str, serialized_data: str) -> None:
+    def load_raw(
+        self, version_str: str, serialized_data: Union[Dict[str, Any], str]
+    ) -> None:
         """ Load save data back into structure """
 
         # check save version is safe before upgrading
         try:
-            save_semver = VersionInfo.parse(version_str)
+            save_semver = parse_version(version_str)
         except ValueError as err:
             raise QuestLoadError(f"Invalid version string {version_str}") from err
 
@@ -128,21 +177,31 @@ class Quest(ABC):
                 f"{self} Unsafe version mismatch in! {save_semver} -> {self.version}"
             )
 
+        # always validate, as it coerces saved JSON values back to the model's types
         try:
-            self.quest_data = self.QuestDataModel.parse_raw(serialized_data)
+            if isinstance(serialized_data, str):
+                self.quest_data = self.QuestDataModel.parse_raw(serialized_data)
+            else:
+                self.quest_data = self.QuestDataModel.parse_obj(serialized_data)
         except ValidationError as err:
             raise QuestLoadError(f"{self} data validation error! {err}") from err
 
-    def save_raw(self) -> str:
-        """ Returns serialized data to save """
-        return self.quest_data.json()
+    def save_raw(self) -> Dict[str, Any]:
+        """ Returns serialized data to save, coerced to JSON types for Firestore """
+        return json.loads(self.quest_data.json())
 
     def execute(self, tick_type: TickType) -> None:
         """ Executes stages, tick_type helps nodes know whether to skip certain stages """
 
+        # quests without any stage edges have nothing to execute
+        if not self.stage_edges:
+            logger.debug("No stages", quest=self)
+            return
+
         log = logger.bind(quest=self)
         log.info("Begin execution")
 
+        self.load_stages()
         while self.graph.is_active():
             ready_nodes = self.graph.get_ready()
 
@@ -150,41 +209,50 @@ class Quest(ABC):
                 log.info("No more ready nodes, stopping execution")
                 break
 
-            log.info("Got Ready nodes", ready_nodes=ready_nodes)
+            log.debug("Got Ready nodes", ready_nodes=ready_nodes)
 
-            for node in ready_nodes:
-                # skip if completed, avoids triggering two final stages
-                if self.quest_page.is_quest_complete():
-                    log.info("Done flag set, skipping the rest")
-                    return
-
-                # completed node: TODO: just not put completed nodes into the graph?
-                if self.quest_page.is_stage_complete(node):
-                    self.graph.done(node)
-                    log.info(
-                        "Node is already complete, skipping",
-                        node=node,
-                    )
-                    continue
+            # skip if an earlier batch completed the quest, e.g. a final stage
+            if self.quest_page.is_quest_complete():
+                log.info("Done flag set, skipping the rest")
+                return
 
+            runnable: List[Tuple[str, Stage]] = []
+            final_stages: List[Tuple[str, Stage]] = []
+            for node in ready_nodes:
                 log_node = log.bind(node=node)
-                log_node.info("Begin processing stage")
+                log_node.debug("Begin processing stage")
 
-                # instantiate stage and execute
+                # instantiate stage and check whether it should run
                 StageClass = self.stages[node]
                 stage = StageClass(self)
                 stage.prepare()
 
                 if stage.condition():
                     log_node.info("Condition check passed, executing")
-                    stage.execute()
+                    if isinstance(stage, FinalStage):
+                        final_stages.append((node, stage))
+                    else:
+                        runnable.append((node, stage))
 
-                    if stage.is_done():
-                        log_node.info("Stage reports done")
-                        self.quest_page.mark_stage_complete(node)
-                        self.graph.done(node)
+            # non-final ready nodes are independent, so execute them concurrently
+            for (node, _), done in zip(runnable, execute_stages(runnable)):
+                self.complete_stage(node, done)
+
+            # final stages then run one at a time, so at most one ends the quest
+            for node, stage in final_stages:
+                if self.quest_page.is_quest_complete():
+                    log.info("Done flag set, skipping the rest")
+                    return
+                self.complete_stage(node, run_stage(stage))
 
         log.info("Done processing node")
 
+    def complete_stage(self, node: str, done: bool) -> None:
+        """ Marks an executed stage complete if it reports done """
+        if done:
+            logger.info("Stage reports done", quest=self, node=node)
+            self.quest_page.mark_stage_complete(node)
+            self.graph.done(node)
+
     def __repr__(self):
         return f"{self.__class__.__name__}(quest_page={self.quest_page})"
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from typing import List, Optional, ClassVar, Any, Callable, TYPE_CHECKING
+from typing import List, Dict, Type, Optional, ClassVar, Any, Callable, TYPE_CHECKING
 from abc import ABC, abstractmethod
 import operator
+from collections import defaultdict
 from structlog import get_logger
 
 from character import Character
@@ -14,6 +15,11 @@ logger = get_logger(__name__)
 if TYPE_CHECKING:
     from .quest import Quest  # pragma: no cover
 
+# stages by name, keyed by the qualified name of the class they are defined in.
+# Quest subclasses pop their entry when defined, so stages must be defined inline
+# in the quest; stages nested in any other class leave their entry behind
+stage_registry: Dict[str, Dict[str, Type[Stage]]] = defaultdict(dict)
+
 
 class Stage(ABC):
     """A stage holds the quest stage, the execution flow is:
@@ -25,8 +31,17 @@ class Stage(ABC):
         if stage.is_done():
             ...
 
+    Stages are collected by the quest they are defined inside, so they must be
+    defined inline in the quest's class body rather than assigned to it.
     """
 
+    def __init_subclass__(cls):
+        """ Register the stage against its enclosing class, for Quest to collect """
+        super().__init_subclass__()
+        if "." in cls.__qualname__:
+            parent_name, name = cls.__qualname__.rsplit(".", 1)
+            stage_registry[f"{cls.__module__}.{parent_name}"][name] = cls
+
     @property
     @abstractmethod
     def children(cls) -> List[str]:
@@ -42,7 +57,8 @@ class Stage(ABC):
         return True
 
     def execute(self) -> None:
-        """ Run the stage """
+        """Run the stage. Sibling stages may execute concurrently in other threads,
+        so hold self.quest.lock while writing quest data"""
         return
 
     def is_done(self) -> bool:
@@ -109,6 +125,7 @@ class FinalStage(Stage):
     """ For ending the quest """
 
     def __init_subclass__(cls):
+        super().__init_subclass__()
         cls.children = []
 
     def execute(self) -> None:
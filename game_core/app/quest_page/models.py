@@ -1,12 +1,21 @@
 """ Data models for quests """
 
-from typing import List
+from typing import Set, Dict, Any, Union
 from pydantic import BaseModel, Field
 
 
 class QuestData(BaseModel):
     quest_name: str = Field("", title="Name of the Quest")
     version: str = Field("", title="Version number to control loading")
-    completed_stages: List[str] = Field([], title="List of completed stage names")
-    serialized_data: str = Field("", title="Serialized save data")
+    completed_stages: Set[str] = Field(set(), title="Set of completed stage names")
+    serialized_data: Union[Dict[str, Any], str] = Field(
+        {}, title="Serialized save data, str if saved by older versions"
+    )
     complete: bool = Field(False, title="Whether quest is completed")
+
+    def dict(self, **kwargs) -> Dict[str, Any]:
+        """ Firestore has no sets, so completed_stages is stored as a list """
+        data = super().dict(**kwargs)
+        if "completed_stages" in data:
+            data["completed_stages"] = sorted(data["completed_stages"])
+        return data
@@ -1,8 +1,10 @@
 """ Base Classes for quest objects """
 from __future__ import annotations
-from typing import Generator
+from typing import Generator, Optional
 from structlog import get_logger
 
+from google.cloud.firestore_v1.batch import WriteBatch  # type: ignore
+
 from orm import Orm
 from game import Game
 
@@ -39,10 +41,8 @@ class QuestPage(Orm, collection="quest", parent_orm=Game):
         """ Iterate over all quests, the generator yields loaded quest_pages """
         docs = cls.col_ref.where("complete", "!=", True).stream()
         for doc in docs:
-            data = cls.storage_model.parse_obj(doc.to_dict())
-            quest_page = cls(doc.id, data.quest_name)
-            quest_page.data = data
-            quest_page.quest.load_raw(data.version, data.serialized_data)
+            quest_page = cls(doc.id, doc.get("quest_name"))
+            quest_page.load_snapshot(doc)
             yield quest_page
 
     def __init__(self, key: str, quest_name):
@@ -50,18 +50,20 @@ class QuestPage(Orm, collection="quest", parent_orm=Game):
         self.quest = Quest.from_name(quest_name, self)
         self.data.quest_name = quest_name
 
-    def load(self) -> None:
+    def load_storage_model(self, data: dict) -> None:
         """ Additionally parse the quest storage """
-        super().load()
+        super().load_storage_model(data)
         if isinstance(self.quest, Quest):
             self.quest.load_raw(self.data.version, self.data.serialized_data)
 
-    def save(self) -> None:
+    def save(
+        self, batch: Optional[WriteBatch] = None, exists: Optional[bool] = None
+    ) -> None:
         """ Additionally parse out the quest storage """
         if isinstance(self.quest, Quest):
             self.data.serialized_data = self.quest.save_raw()
             self.data.version = str(self.quest.version)
-        super().save()
+        super().save(batch, exists)
 
     def execute(self, tick_type: TickType) -> None:
         """ Execute """
@@ -69,8 +71,7 @@ class QuestPage(Orm, collection="quest", parent_orm=Game):
 
     def mark_stage_complete(self, stage_name: str) -> None:
         """ Mark a stage as completed """
-        if stage_name not in self.data.completed_stages:
-            self.data.completed_stages.append(stage_name)
+        self.data.completed_stages.add(stage_name)
 
     def is_stage_complete(self, stage_name: str) -> bool:
         """ Returns whether stage is completed """
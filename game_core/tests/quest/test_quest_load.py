@@ -2,9 +2,12 @@
 
 import json
 import pytest
+from enum import Enum
+from typing import Set, Dict
 
 from semver import VersionInfo
-from quest import QuestLoadError
+from quest import Quest, Difficulty, QuestLoadError
+from quest.quest import QuestBaseModel
 
 
 def test_quest_load_version_fail(testing_quest_page):
@@ -58,3 +61,99 @@ def test_quest_load_save(testing_quest_page):
     assert testing_quest_page.exists
 
     testing_quest_page.load()
+
+
+def test_quest_load_dict_data_fail(testing_quest_page):
+    """ Tests a quest load fail due to data model mismatch in stored map data """
+    testing_quest_page.save()
+
+    # fetch the data
+    doc = testing_quest_page.doc_ref.get()
+    data = testing_quest_page.storage_model.parse_obj(doc.to_dict())
+
+    # mess with the data
+    data.serialized_data = {"this": "nonesense"}
+    testing_quest_page.doc_ref.set(data.dict())
+
+    # try to load with the bad data
+    with pytest.raises(QuestLoadError):
+        testing_quest_page.load()
+
+    # cleanup
+    testing_quest_page.delete()
+
+
+def test_quest_load_save_data(testing_quest_page):
+    """ Tests quest data survives a save/load """
+    testing_quest_page.quest.quest_data.a = 5
+    testing_quest_page.save()
+
+    testing_quest_page.quest.quest_data.a = 1
+    testing_quest_page.load()
+    assert testing_quest_page.quest.quest_data.a == 5
+
+    # cleanup
+    testing_quest_page.delete()
+
+
+def test_quest_load_same_version_validated(testing_quest_page):
+    """ Tests dict data is validated even when saved by the same version """
+    quest = testing_quest_page.quest
+
+    with pytest.raises(QuestLoadError):
+        quest.load_raw(str(quest.version), {"this": "nonesense"})
+
+
+class Colour(Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+class NativeTypesQuest(Quest):
+    class QuestDataModel(QuestBaseModel):
+        colour: Colour = Colour.RED
+        seen: Set[str] = set()
+
+    version = VersionInfo.parse("1.0.0")
+    difficulty = Difficulty.RESERVED
+    description = "This is a quest to test fields that aren't JSON-native"
+
+
+def test_quest_load_native_types(testing_quest_page):
+    """ Tests non-JSON-native fields keep their types through save/load """
+    quest = NativeTypesQuest(testing_quest_page)
+    quest.quest_data.colour = Colour.BLUE
+    quest.quest_data.seen.add("a")
+
+    quest.load_raw(str(quest.version), quest.save_raw())
+    assert quest.quest_data.colour is Colour.BLUE
+    assert quest.quest_data.seen == {"a"}
+
+    # sets must still behave as sets after loading
+    quest.quest_data.seen.add("b")
+
+
+class MapQuest(Quest):
+    class QuestDataModel(QuestBaseModel):
+        entries: Dict[str, int] = {}
+
+    version = VersionInfo.parse("1.0.0")
+    difficulty = Difficulty.RESERVED
+    description = "This is a quest to test nested map storage"
+
+
+def test_quest_save_removes_map_keys(testing_quest_page):
+    """ Tests keys removed from nested quest data don't survive a save """
+    testing_quest_page.quest = MapQuest(testing_quest_page)
+    testing_quest_page.quest.quest_data.entries = {"keep": 1, "drop": 2}
+    testing_quest_page.save()
+
+    # remove a key and save over the existing document
+    del testing_quest_page.quest.quest_data.entries["drop"]
+    testing_quest_page.save()
+
+    testing_quest_page.load()
+    assert testing_quest_page.quest.quest_data.entries == {"keep": 1}
+
+    # cleanup
+    testing_quest_page.delete()
@@ -1,11 +1,14 @@
 """ Test for quest load/save handling system """
 
 import pytest
+from typing import List
+from threading import Barrier
 from semver import VersionInfo  # type:  ignore
 
 from tick import TickType
 from quest import Quest, Difficulty, QuestDefinitionError, DEBUG_QUEST_NAME
-from quest.stage import DebugStage
+from quest.quest import QuestBaseModel
+from quest.stage import DebugStage, FinalStage
 from quest.loader import all_quests
 from quest.content.debug import DebugQuest
 
@@ -15,29 +18,87 @@ class BadQuest(Quest):
     description = "Bad quest for testing, it is missing stuff"
 
 
-class BadStageCycle(Quest):
+class RecordStage(DebugStage):
+    """ Records its execution in the quest data """
+
+    def execute(self) -> None:
+        with self.quest.lock:
+            self.quest.quest_data.executed.append(self.__class__.__name__)
+
+
+# both sibling stages must reach this together, which only happens concurrently
+parallel_barrier = Barrier(2)
+
+
+class BarrierStage(RecordStage):
+    """ Waits for a concurrently executing sibling before recording itself """
+
+    def execute(self) -> None:
+        parallel_barrier.wait(timeout=5)
+        super().execute()
+
+
+class TestQuestParallel(Quest):
+    class QuestDataModel(QuestBaseModel):
+        executed: List[str] = []
+
     version = VersionInfo.parse("1.0.0")
     difficulty = Difficulty.RESERVED
-    description = "Bad quest for testing, it has malformed stages"
+    description = "This is a quest to test concurrent stages"
+
+    class Start(RecordStage):
+        children = ["Left", "Right"]
+
+    class Left(BarrierStage):
+        children = ["Middle"]
+
+    class Right(BarrierStage):
+        children = ["End"]
+
+    class Middle(RecordStage):
+        children = ["End"]
+
+    class End(FinalStage):
+        pass
+
+
+class TestQuestFinalSibling(Quest):
+    class QuestDataModel(QuestBaseModel):
+        executed: List[str] = []
+
+    version = VersionInfo.parse("1.0.0")
+    difficulty = Difficulty.RESERVED
+    description = "This is a quest to test a final stage with ready siblings"
+
+    class Start(RecordStage):
+        children = ["Left", "Right", "End"]
+
+    class Left(RecordStage):
+        children = []
 
-    class Start(DebugStage):
-        children = ["Loop"]
+    class Right(RecordStage):
+        children = []
 
-    class Loop(DebugStage):
-        """ This should form a cycle, and get flagged by test """
+    class End(FinalStage):
+        pass
 
-        children = ["Start"]
 
+class TestQuestChain(Quest):
+    class QuestDataModel(QuestBaseModel):
+        executed: List[str] = []
 
-class BadStageNotExist(Quest):
     version = VersionInfo.parse("1.0.0")
     difficulty = Difficulty.RESERVED
-    description = "Bad quest for testing, it has malformed stages"
+    description = "This is a quest to test resuming a linear chain"
 
-    class Start(DebugStage):
-        """ This references a stage that doesn't exist, and get flagged """
+    class First(RecordStage):
+        children = ["Second"]
 
-        children = ["Loop"]
+    class Second(RecordStage):
+        children = ["Third"]
+
+    class Third(RecordStage):
+        children = []
 
 
 def test_all_quest_instantiate(testing_quest_page):
@@ -57,14 +118,35 @@ def test_fail_instantiate(testing_quest_page):
         BadQuest(testing_quest_page)
 
 
-def test_fail_stage(testing_quest_page):
-    """ Test bad quests that fail due to stage problems """
+def test_fail_stage():
+    """ Test bad quests that fail at definition due to stage problems """
 
     with pytest.raises(QuestDefinitionError):
-        quest = BadStageCycle(testing_quest_page)
+
+        class BadStageCycle(Quest):
+            version = VersionInfo.parse("1.0.0")
+            difficulty = Difficulty.RESERVED
+            description = "Bad quest for testing, it has malformed stages"
+
+            class Start(DebugStage):
+                children = ["Loop"]
+
+            class Loop(DebugStage):
+                """ This should form a cycle, and get flagged by test """
+
+                children = ["Start"]
 
     with pytest.raises(QuestDefinitionError):
-        quest = BadStageNotExist(testing_quest_page)
+
+        class BadStageNotExist(Quest):
+            version = VersionInfo.parse("1.0.0")
+            difficulty = Difficulty.RESERVED
+            description = "Bad quest for testing, it has malformed stages"
+
+            class Start(DebugStage):
+                """ This references a stage that doesn't exist, and get flagged """
+
+                children = ["Loop"]
 
 
 def test_quest_has_stages(testing_quest_page):
@@ -97,7 +179,7 @@ def test_resume(testing_quest_page):
     """ Test quest resume """
 
     # manually set completed stages
-    testing_quest_page.data.completed_stages = ["Start"]
+    testing_quest_page.data.completed_stages = {"Start"}
 
     # resume
     testing_quest_page.execute(TickType.FULL)
@@ -116,3 +198,44 @@ def test_done_skip(testing_quest_page):
     # excecution should just skip because we marked quest as complete
     testing_quest_page.execute(TickType.FULL)
     assert not testing_quest_page.data.completed_stages
+
+
+def test_execute_parallel(testing_quest_page):
+    """ Test independent stages both passing their conditions and executing """
+
+    parallel_barrier.reset()
+    quest = TestQuestParallel(testing_quest_page)
+    quest.execute(TickType.FULL)
+
+    assert sorted(quest.quest_data.executed) == ["Left", "Middle", "Right", "Start"]
+    assert len(testing_quest_page.data.completed_stages) == len(quest.stages)
+    assert testing_quest_page.is_quest_complete()
+
+
+def test_execute_final_sibling(testing_quest_page):
+    """ Test siblings ready alongside a final stage still execute """
+
+    quest = TestQuestFinalSibling(testing_quest_page)
+    quest.execute(TickType.FULL)
+
+    assert sorted(quest.quest_data.executed) == ["Left", "Right", "Start"]
+    assert testing_quest_page.data.completed_stages == {"Start", "Left", "Right", "End"}
+    assert testing_quest_page.is_quest_complete()
+
+
+@pytest.mark.parametrize(
+    "completed, expected",
+    [
+        ({"Second"}, ["First", "Third"]),  # child completed, parent pending
+        ({"First", "Second"}, ["Third"]),  # parent and child both completed
+    ],
+)
+def test_resume_skips_completed(testing_quest_page, completed, expected):
+    """ Test completed stages are left out, and the rest run exactly once """
+    testing_quest_page.data.completed_stages = set(completed)
+
+    quest = TestQuestChain(testing_quest_page)
+    quest.execute(TickType.FULL)
+
+    assert sorted(quest.quest_data.executed) == expected
+    assert testing_quest_page.data.completed_stages == {"First", "Second", "Third"}
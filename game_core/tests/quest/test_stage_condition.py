@@ -76,3 +76,19 @@ def test_ending2(testing_quest_page):
     assert not testing_quest_page.is_stage_complete("BranchA")
     assert not testing_quest_page.is_stage_complete("EndingA")
     assert testing_quest_page.is_quest_complete()
+
+
+def test_both_branches(testing_quest_page):
+    """ Both branches pass, but only one ending should complete the quest """
+
+    quest = TestQuestBranching(testing_quest_page)
+    quest.quest_data.value_a = 100
+    quest.quest_data.value_b = 100
+    quest.execute(TickType.FULL)
+
+    assert testing_quest_page.is_stage_complete("BranchA")
+    assert testing_quest_page.is_stage_complete("BranchB")
+    assert testing_quest_page.is_stage_complete(
+        "EndingA"
+    ) != testing_quest_page.is_stage_complete("EndingB")
+    assert testing_quest_page.is_quest_complete()
@@ -6,6 +6,9 @@ from base64 import b64encode
 
 from functions_framework import create_app  # type: ignore
 from tick import TickEvent, TickType
+from quest import DEBUG_QUEST_NAME
+from quest_page import QuestPage
+from main import TICK_BATCH_WRITES
 
 FUNCTION_SOURCE = "app/main.py"
 
@@ -58,3 +61,28 @@ def test_tick(tick_client, tick_payload, testing_quest_page):
     assert len(testing_quest_page.data.completed_stages) == len(
         testing_quest_page.quest.stages
     )
+
+
+def test_tick_batches(tick_client, tick_payload, testing_game):
+    """ Test tick over more quest pages than fit in one batch commit """
+
+    # create quests over several batches
+    quest_pages = []
+    for idx in range(TICK_BATCH_WRITES * 2 + 1):
+        key = QuestPage.make_key(testing_game, f"{DEBUG_QUEST_NAME}_{idx}")
+        quest_page = QuestPage(key, DEBUG_QUEST_NAME)
+        quest_page.parent_key = testing_game.key
+        quest_page.save()
+        quest_pages.append(quest_page)
+
+    res = tick_client.post("/", json=tick_payload)
+    assert res.status_code == 200
+
+    # check all of them got saved, keeping their parent
+    for quest_page in quest_pages:
+        quest_page.load()
+        assert quest_page.is_quest_complete()
+        assert quest_page.parent_key == testing_game.key
+
+        # cleanup
+        quest_page.delete()